@@ -10,6 +10,7 @@ import pandas as pd
 from sklearn.preprocessing import LabelEncoder
 
 from dice_ml.data_interfaces.base_data_interface import _BaseData
+from dice_ml.utils.exception import UserConfigValidationException
 
 
 class PrivateData(_BaseData):
@@ -47,34 +48,38 @@ class PrivateData(_BaseData):
         self._validate_and_set_outcome_name(params=params)
         self._validate_and_set_type_and_precision(params=params)
 
-        self.continuous_feature_names = []
-        self.categorical_feature_names = []
-        self.categorical_levels = {}
-
-        for feature in features_dict:
-            if isinstance(features_dict[feature][0], (int, float)):  # continuous feature
-                self.continuous_feature_names.append(feature)
-            else:
-                self.categorical_feature_names.append(feature)
-                self.categorical_levels[feature] = features_dict[feature]
-
-        self._validate_and_set_mad(params=params)
-        self._validate_and_set_permitted_range(params=params, features_dict=features_dict)
         self.feature_names = list(features_dict.keys())
         self.number_of_features = len(self.feature_names)
+        self._set_feature_types(features_dict=features_dict)
 
-        self.continuous_feature_indexes = [list(features_dict.keys()).index(
-            name) for name in self.continuous_feature_names if name in features_dict]
-
-        self.categorical_feature_indexes = [list(features_dict.keys()).index(
-            name) for name in self.categorical_feature_names if name in features_dict]
+        self._validate_and_set_mad(params=params)
+        self._validate_and_set_permitted_range(params=params, features_dict=features_dict)
 
         for feature_name in self.continuous_feature_names:
             if feature_name not in self.type_and_precision:
                 self.type_and_precision[feature_name] = 'int'
 
+        self._create_decimal_precisions()
+        self._create_encoded_feature_layout()
         self._validate_and_set_data_name(params=params)
 
+    def _set_feature_types(self, features_dict):
+        """Splits features into continuous (numeric range) and categorical (levels) features, with their indexes."""
+        self.continuous_feature_names = []
+        self.continuous_feature_indexes = []
+        self.categorical_feature_names = []
+        self.categorical_feature_indexes = []
+        self.categorical_levels = {}
+
+        for ix, (feature, values) in enumerate(features_dict.items()):
+            if isinstance(values[0], (int, float, np.integer, np.floating)) and not isinstance(values[0], bool):
+                self.continuous_feature_names.append(feature)
+                self.continuous_feature_indexes.append(ix)
+            else:
+                self.categorical_feature_names.append(feature)
+                self.categorical_feature_indexes.append(ix)
+                self.categorical_levels[feature] = sorted(values)
+
     def _validate_and_set_type_and_precision(self, params):
         """Validate and set the type and precision."""
         if 'type_and_precision' in params:
@@ -82,6 +87,14 @@ class PrivateData(_BaseData):
         else:
             self.type_and_precision = {}
 
+    def _create_decimal_precisions(self):
+        """Creates the decimal precisions of continuous features from their type and precision."""
+        self._precisions = np.zeros(len(self.feature_names), dtype=np.int32)
+        for ix, feature_name in enumerate(self.continuous_feature_names):
+            type_prec = self.type_and_precision[feature_name]
+            self._precisions[ix] = 0 if type_prec == 'int' else type_prec[1]
+        self._precisions_dict = dict(zip(self.continuous_feature_names, self._precisions.tolist()))
+
     def _validate_and_set_mad(self, params):
         """Validate and set the MAD."""
         if 'mad' in params:
@@ -89,75 +102,127 @@ class PrivateData(_BaseData):
         else:
             self.mad = {}
 
+    def _check_categories(self, feature_name, values):
+        """Raises an error if a categorical value is not one of the known categories of the feature."""
+        unknown_categories = [value for value in values if value not in self._cat_value_to_offset[feature_name]]
+        if len(unknown_categories) > 0:
+            raise UserConfigValidationException(
+                'The category {0} does not occur in the training data for feature {1}.'
+                ' Allowed categories are {2}'.format(
+                    unknown_categories[0], feature_name, self.categorical_levels[feature_name]))
+
+    def _encode_dummies(self, data):
+        """Gets the one-hot-encoded block of the categorical features of data as a uint8 array. Every category gets a
+           column, even if it does not occur in the data."""
+        dummies = np.zeros((len(data), len(self._encoded_cat_cols)), dtype=np.uint8)
+        for feature_name in self.categorical_feature_names:
+            values = data[feature_name]
+            codes = self._cat_dtypes[feature_name].categories.get_indexer(values)
+            self._check_categories(feature_name, values[(codes < 0) & values.notna().to_numpy()])
+            rows = np.flatnonzero(codes >= 0)
+            dummies[rows, self._cat_col_slices[feature_name].start + codes[rows]] = 1
+        return dummies
+
     def one_hot_encode_data(self, data):
         """One-hot-encodes the data."""
-        return pd.get_dummies(data, drop_first=False, columns=self.categorical_feature_names)
+        other_cols = [col for col in data.columns if col not in self._cat_col_groups]
+        dummies = pd.DataFrame(self._encode_dummies(data), columns=self._encoded_cat_cols, index=data.index)
+        return pd.concat([data[other_cols], dummies], axis=1)
+
+    @property
+    def permitted_range(self):
+        return self._permitted_range
+
+    @permitted_range.setter
+    def permitted_range(self, permitted_range):
+        """Sets the permitted range and caches the min and range of continuous features as arrays."""
+        self._permitted_range = permitted_range
+        self._cont_cols = list(self.continuous_feature_names)
+        self._cont_min = np.array([permitted_range[f][0] for f in self._cont_cols], dtype=np.float64)
+        self._cont_max = np.array([permitted_range[f][1] for f in self._cont_cols], dtype=np.float64)
+        self._cont_range = self._cont_max - self._cont_min
+        # data params for gradient-based DiCE depend on the permitted range
+        self._data_params_cache = None
+
+    def normalize_arrays(self, cont_arr):
+        """Normalizes, in place, a float array of continuous feature values (features on the last axis, in the order
+           of continuous_feature_names) to the range [0,1]. Features with min == max are set to 0."""
+        cont_arr -= self._cont_min
+        np.divide(cont_arr, self._cont_range, out=cont_arr, where=self._cont_range != 0)
+        cont_arr[..., self._cont_range == 0] = 0
+        return cont_arr
+
+    def de_normalize_arrays(self, cont_arr):
+        """De-normalizes, in place, a float array of continuous feature values (features on the last axis, in the
+           order of continuous_feature_names) from [0,1] range to original range."""
+        cont_arr *= self._cont_range
+        cont_arr += self._cont_min
+        return cont_arr
+
+    def _get_continuous_array(self, df):
+        """Gets a new float array of the continuous columns of a dataframe."""
+        return df[self._cont_cols].to_numpy(dtype=np.float64, copy=True)
+
+    def _get_normalized_continuous_array(self, df):
+        """Gets the normalized continuous columns of a dataframe. The values stay float64 so that they can be
+           de-normalized back to their original precision."""
+        return self.normalize_arrays(self._get_continuous_array(df))
+
+    def _replace_continuous_columns(self, df, values):
+        """Returns a new dataframe with the continuous columns of df replaced by the columns of values. The other
+           columns are shared with df instead of being copied."""
+        columns = {col: df[col] for col in df.columns}
+        columns.update(zip(self._cont_cols, values.T))
+        return pd.DataFrame(columns, index=df.index, copy=False)
 
     def normalize_data(self, df):
         """Normalizes continuous features to make them fall in the range [0,1]."""
-        result = df.copy()
-        if isinstance(df, pd.DataFrame) or isinstance(df, dict):
-            for feature_name in self.continuous_feature_names:
-                max_value = self.permitted_range[feature_name][1]
-                min_value = self.permitted_range[feature_name][0]
-                if min_value == max_value:
-                    result[feature_name] = 0
-                else:
-                    result[feature_name] = (df[feature_name] - min_value) / (max_value - min_value)
+        if len(self._cont_cols) == 0:
+            return df.copy()
+        if isinstance(df, pd.DataFrame):
+            return self._replace_continuous_columns(
+                df, self._get_normalized_continuous_array(df))
+        elif isinstance(df, dict):
+            result = df.copy()
+            scaled = self.normalize_arrays(
+                np.stack([np.asarray(df[f], dtype=np.float64) for f in self._cont_cols], axis=-1))
+            result.update(zip(self._cont_cols, np.moveaxis(scaled, -1, 0)))
         else:
-            result = result.astype('float')
-            for feature_index in self.continuous_feature_indexes:
-                feature_name = self.feature_names[feature_index]
-                max_value = self.permitted_range[feature_name][1]
-                min_value = self.permitted_range[feature_name][0]
-                if len(df.shape) == 1:
-                    if min_value == max_value:
-                        value = 0
-                    else:
-                        value = (df[feature_index] - min_value) / (max_value - min_value)
-                    result[feature_index] = value
-                else:
-                    if min_value == max_value:
-                        result[:, feature_index] = np.zeros(len(df[:, feature_index]))
-                    else:
-                        result[:, feature_index] = (df[:, feature_index] - min_value) / (max_value - min_value)
+            result = df.astype('float')
+            result[..., self.continuous_feature_indexes] = self.normalize_arrays(
+                result[..., self.continuous_feature_indexes])
         return result
 
     def de_normalize_data(self, df):
         """De-normalizes continuous features from [0,1] range to original range."""
         if len(df) == 0:
             return df
+        if isinstance(df, pd.DataFrame):
+            return self._replace_continuous_columns(
+                df, self.de_normalize_arrays(self._get_continuous_array(df)))
         result = df.copy()
-        for feature_name in self.continuous_feature_names:
-            max_value = self.permitted_range[feature_name][1]
-            min_value = self.permitted_range[feature_name][0]
-            result[feature_name] = (
-                df[feature_name]*(max_value - min_value)) + min_value
+        for ix, feature_name in enumerate(self._cont_cols):
+            result[feature_name] = (df[feature_name] * self._cont_range[ix]) + self._cont_min[ix]
         return result
 
     def get_minx_maxx(self, normalized=True):
         """Gets the min/max value of features in normalized or de-normalized form."""
-        minx = np.array([[0.0]*len(self.ohe_encoded_feature_names)])
-        maxx = np.array([[1.0]*len(self.ohe_encoded_feature_names)])
+        minx = np.zeros((1, len(self.ohe_encoded_feature_names)))
+        maxx = np.ones((1, len(self.ohe_encoded_feature_names)))
 
-        if normalized:
-            return minx, maxx
-        else:
-            for idx, feature_name in enumerate(self.continuous_feature_names):
-                minx[0][idx] = self.permitted_range[feature_name][0]
-                maxx[0][idx] = self.permitted_range[feature_name][1]
-            return minx, maxx
+        if not normalized:
+            minx[0, self._cont_encoded_idx] = self._cont_min
+            maxx[0, self._cont_encoded_idx] = self._cont_max
+        return minx, maxx
 
     def get_mads(self, normalized=True):
         """Computes Median Absolute Deviation of features."""
         if normalized is False:
             return self.mad.copy()
         else:
-            mads = {}
-            for feature in self.continuous_feature_names:
-                if feature in self.mad:
-                    mads[feature] = (self.mad[feature])/(self.permitted_range[feature][1] - self.permitted_range[feature][0])
-            return mads
+            # features with min == max cannot be normalized, so get_valid_mads falls back to 1.0 for them
+            return {feature: self.mad[feature] / self._cont_range[ix]
+                    for ix, feature in enumerate(self._cont_cols) if feature in self.mad and self._cont_range[ix] != 0}
 
     def get_valid_mads(self, normalized=False, display_warnings=False, return_mads=True):
         """Computes Median Absolute Deviation of features. If they are <=0, returns a practical value instead"""
@@ -180,13 +245,8 @@ class PrivateData(_BaseData):
         if features_dict is None:
             features_dict = self.permitted_range
 
-        ranges = {}
         # Getting default ranges based on the dataset
-        for feature in features_dict:
-            if type(features_dict[feature][0]) is int:  # continuous feature
-                ranges[feature] = features_dict[feature]
-            else:
-                ranges[feature] = features_dict[feature]
+        ranges = dict(features_dict)
         feature_ranges_orig = ranges.copy()
         # Overwriting the ranges for a feature if input provided
         if permitted_range_input is not None:
@@ -194,35 +254,65 @@ class PrivateData(_BaseData):
                 ranges[feature_name] = feature_range
         return ranges, feature_ranges_orig
 
-    def create_ohe_params(self, one_hot_encoded_data=None):
-        if len(self.categorical_feature_names) > 0:
-            # simulating sklearn's one-hot-encoding
-            # continuous features on the left
-            self.ohe_encoded_feature_names = [
-                feature for feature in self.continuous_feature_names]
-            for feature_name in self.categorical_feature_names:
-                for category in sorted(self.categorical_levels[feature_name]):
-                    self.ohe_encoded_feature_names.append(
-                        feature_name+'_'+category)
-        else:
-            # one-hot-encoded data is same as original data if there is no categorical features.
-            self.ohe_encoded_feature_names = [feat for feat in self.feature_names]
+    def _create_encoded_feature_layout(self):
+        """Creates the one-hot-encoded feature names and the index of each encoded column. The layout only
+           depends on the meta data, so it is built once when the data object is created."""
+        # simulating sklearn's one-hot-encoding
+        # continuous features on the left, followed by the (sorted) levels of each categorical feature.
+        # one-hot-encoded data is same as original data if there is no categorical features.
+        self._cat_col_groups = {
+            feature_name: [feature_name+'_'+str(category) for category in self.categorical_levels[feature_name]]
+            for feature_name in self.categorical_feature_names}
+        self._cat_dtypes = {feature_name: pd.CategoricalDtype(categories=self.categorical_levels[feature_name])
+                            for feature_name in self.categorical_feature_names}
+        # positions of features in a raw instance, and the dummy column offset of each category
+        self._cont_positions = list(self.continuous_feature_indexes)
+        self._cat_positions = list(self.categorical_feature_indexes)
+        self._cat_value_to_offset = {}
+        # all dummy columns in encoded order
+        self._encoded_cat_cols = [col for feature_name in self.categorical_feature_names
+                                  for col in self._cat_col_groups[feature_name]]
+        self.ohe_encoded_feature_names = self.continuous_feature_names + self._encoded_cat_cols
+
+        # continuous features are always the leading encoded columns
+        num_continuous = len(self.continuous_feature_names)
+        self._cont_encoded_idx = np.arange(num_continuous)
+        # slice of each categorical feature within the dummy columns, and its encoded column indexes
+        self._cat_col_slices = {}
+        self._encoded_cat_indexes = []
+        start = 0
+        for feature_name in self.categorical_feature_names:
+            end = start + len(self.categorical_levels[feature_name])
+            self._cat_col_slices[feature_name] = slice(start, end)
+            self._cat_value_to_offset[feature_name] = {
+                category: start + ix for ix, category in enumerate(self.categorical_levels[feature_name])}
+            self._encoded_cat_indexes.append(list(range(num_continuous + start, num_continuous + end)))
+            start = end
+        # indexes of the encoded columns of each original feature
+        self._prefix_to_indices = {feature_name: [ix] for ix, feature_name in enumerate(self.continuous_feature_names)}
+        self._prefix_to_indices.update(zip(self.categorical_feature_names, self._encoded_cat_indexes))
 
+    def create_ohe_params(self, one_hot_encoded_data=None):
         # base dataframe for doing one-hot-encoding
-        # ohe_encoded_feature_names and ohe_base_df are created (and stored as data class's parameters)
-        # when get_data_params_for_gradient_dice() is called from gradient-based DiCE explainers
+        # ohe_encoded_feature_names are created when the data object is initialized, ohe_base_df is created
+        # (and stored as data class's parameter) when get_data_params_for_gradient_dice() is called from
+        # gradient-based DiCE explainers
         self.ohe_base_df = self.prepare_df_for_ohe_encoding()
 
     def get_data_params_for_gradient_dice(self):
-        """Gets all data related params for DiCE."""
-
-        self.create_ohe_params()
+        """Gets all data related params for DiCE. The params are computed once and cached until the permitted
+           range changes."""
+        if self._data_params_cache is None:
+            self.create_ohe_params()
+            self._data_params_cache = self._compute_data_params_for_gradient_dice()
+        return self._data_params_cache
+
+    def _compute_data_params_for_gradient_dice(self):
         minx, maxx = self.get_minx_maxx(normalized=True)
 
         # get the column indexes of categorical and continuous features after one-hot-encoding
         encoded_categorical_feature_indexes = self.get_encoded_categorical_feature_indexes()
-        flattened_indexes = [item for sublist in encoded_categorical_feature_indexes for item in sublist]
-        encoded_continuous_feature_indexes = [ix for ix in range(len(minx[0])) if ix not in flattened_indexes]
+        encoded_continuous_feature_indexes = self._cont_encoded_idx.tolist()
 
         # min and max for continuous features in original scale
         org_minx, org_maxx = self.get_minx_maxx(normalized=False)
@@ -230,35 +320,21 @@ class PrivateData(_BaseData):
         cont_maxx = list(org_maxx[0][encoded_continuous_feature_indexes])
 
         # decimal precisions for continuous features
-        cont_precisions = [self.get_decimal_precisions()[ix] for ix in range(len(self.continuous_feature_names))]
+        cont_precisions = self.get_decimal_precisions()[:len(self.continuous_feature_names)]
 
         return minx, maxx, encoded_categorical_feature_indexes, encoded_continuous_feature_indexes, \
             cont_minx, cont_maxx, cont_precisions
 
     def get_encoded_categorical_feature_indexes(self):
         """Gets the column indexes categorical features after one-hot-encoding."""
-        cols = []
-        for col_parent in self.categorical_feature_names:
-            temp = [self.ohe_encoded_feature_names.index(
-                col) for col in self.ohe_encoded_feature_names if col.startswith(col_parent) and
-                   col not in self.continuous_feature_names]
-            cols.append(temp)
-        return cols
+        return self._encoded_cat_indexes
 
     def get_indexes_of_features_to_vary(self, features_to_vary='all'):
         """Gets indexes from feature names of one-hot-encoded data."""
         if features_to_vary == "all":
             return [i for i in range(len(self.ohe_encoded_feature_names))]
         else:
-            ixs = []
-            encoded_cats_ixs = self.get_encoded_categorical_feature_indexes()
-            encoded_cats_ixs = [item for sublist in encoded_cats_ixs for item in sublist]
-            for colidx, col in enumerate(self.encoded_feature_names):
-                if colidx in encoded_cats_ixs and col.startswith(tuple(features_to_vary)):
-                    ixs.append(colidx)
-                elif colidx not in encoded_cats_ixs and col in features_to_vary:
-                    ixs.append(colidx)
-            return ixs
+            return sorted({ix for feature_name in features_to_vary for ix in self._prefix_to_indices[feature_name]})
 
     def fit_label_encoders(self):
         labelencoders = {}
@@ -280,32 +356,25 @@ class PrivateData(_BaseData):
             return out
 
     def from_dummies(self, data, prefix_sep='_'):
-        """Gets the original data from dummy encoded data with k levels."""
-        out = data.copy()
+        """Gets the original data from dummy encoded data with k levels. Decoded categorical features carry all the
+           known categories of the feature. Dummy columns are named with the '_' separator used by
+           ohe_encoded_feature_names, so prefix_sep cannot be changed."""
+        if prefix_sep != '_':
+            raise ValueError("prefix_sep should be '_', the separator used in ohe_encoded_feature_names")
+        out = data.drop(self._encoded_cat_cols, axis=1)
+        # a single contiguous array of all dummy columns, sliced per feature
+        encoded = np.ascontiguousarray(data[self._encoded_cat_cols].to_numpy())
         for feature_name in self.categorical_feature_names:
-            cols, labs = [[c.replace(
-                x, "") for c in data.columns if feature_name+prefix_sep in c] for x in ["", feature_name+prefix_sep]]
-            out[feature_name] = pd.Categorical(
-                np.array(labs)[np.argmax(data[cols].values, axis=1)])
-            out.drop(cols, axis=1, inplace=True)
+            codes = encoded[:, self._cat_col_slices[feature_name]].argmax(axis=1)
+            out[feature_name] = pd.Categorical.from_codes(codes, dtype=self._cat_dtypes[feature_name])
         return out
 
     def get_decimal_precisions(self, output_type="list"):
         """"Gets the precision of continuous features in the data."""
-        precisions_dict = defaultdict(int)
-        precisions = [0]*len(self.feature_names)
-        for ix, feature_name in enumerate(self.continuous_feature_names):
-            type_prec = self.type_and_precision[feature_name]
-            if type_prec == 'int':
-                prec = 0
-            else:
-                prec = self.type_and_precision[feature_name][1]
-            precisions[ix] = prec
-            precisions_dict[feature_name] = prec
         if output_type == "list":
-            return precisions
+            return self._precisions.tolist()
         elif output_type == "dict":
-            return precisions_dict
+            return defaultdict(int, self._precisions_dict)
 
     def get_decoded_data(self, data, encoding='one-hot'):
         """Gets the original data from encoded data."""
@@ -330,26 +399,10 @@ class PrivateData(_BaseData):
 
     def prepare_df_for_ohe_encoding(self):
         """Create base dataframe to do OHE for a single instance or a set of instances"""
-        levels = []
-        colnames = [feat for feat in self.categorical_feature_names]
-        for cat_feature in colnames:
-            levels.append(self.categorical_levels[cat_feature])
-
-        if len(colnames) > 0:
-            df = pd.DataFrame({colnames[0]: levels[0]})
-        else:
-            df = pd.DataFrame()
-
-        for col in range(1, len(colnames)):
-            temp_df = pd.DataFrame({colnames[col]: levels[col]})
-            df = pd.concat([df, temp_df], axis=1, sort=False)
-
-        colnames = [feat for feat in self.continuous_feature_names]
-        for col in range(0, len(colnames)):
-            temp_df = pd.DataFrame({colnames[col]: []})
-            df = pd.concat([df, temp_df], axis=1, sort=False)
-
-        return df
+        columns = {feature_name: pd.Series(self.categorical_levels[feature_name])
+                   for feature_name in self.categorical_feature_names}
+        columns.update({feature_name: pd.Series(dtype=np.float64) for feature_name in self.continuous_feature_names})
+        return pd.DataFrame(columns)
 
     def prepare_query_instance(self, query_instance):
         """Prepares user defined test input(s) for DiCE."""
@@ -374,16 +427,40 @@ class PrivateData(_BaseData):
         test = test.reset_index(drop=True)
         return test
 
+    def _encode_single_instance(self, values):
+        """One-hot-encodes and normalizes a single query instance given as raw values in the order of feature_names.
+           Returns the normalized continuous block and the dummy block, each with a single row."""
+        if len(values) != self.number_of_features:
+            raise ValueError("Query instance should have {0} values, one for each of the features {1}, but got {2}".format(
+                self.number_of_features, self.feature_names, len(values)))
+        cont_arr = np.array([[values[ix] for ix in self._cont_positions]], dtype=np.float64)
+        dummies = np.zeros((1, len(self._encoded_cat_cols)), dtype=np.uint8)
+        for feature_name, ix in zip(self.categorical_feature_names, self._cat_positions):
+            if pd.isna(values[ix]):
+                continue
+            self._check_categories(feature_name, [values[ix]])
+            dummies[0, self._cat_value_to_offset[feature_name][values[ix]]] = 1
+        return self.normalize_arrays(cont_arr), dummies
+
     def get_ohe_min_max_normalized_data(self, query_instance):
         """Transforms query_instance into one-hot-encoded and min-max normalized data. query_instance should be a dict,
            a dataframe, a list, or a list of dicts"""
-        query_instance = self.prepare_query_instance(query_instance)
-        ohe_base_df = self.prepare_df_for_ohe_encoding()
-        temp = ohe_base_df.append(query_instance, ignore_index=True, sort=False)
-        temp = self.one_hot_encode_data(temp)
-        temp = temp.tail(query_instance.shape[0]).reset_index(drop=True)
-        # returns a pandas dataframe
-        return self.normalize_data(temp).apply(pd.to_numeric)
+        if isinstance(query_instance, dict) or (isinstance(query_instance, list) and not isinstance(query_instance[0], dict)):
+            # a single query instance is encoded straight from its raw values
+            if isinstance(query_instance, dict):
+                query_instance = [query_instance.get(feature_name) for feature_name in self.feature_names]
+            normalized, dummies = self._encode_single_instance(query_instance)
+            index = pd.RangeIndex(1)
+        else:
+            query_instance = self.prepare_query_instance(query_instance)
+            # continuous features are scaled and categorical features are scattered from their category codes
+            # straight into the encoded layout, without intermediate one-hot-encoded or normalized frames
+            normalized = self._get_normalized_continuous_array(query_instance)
+            dummies = self._encode_dummies(query_instance)
+            index = query_instance.index
+        # returns a pandas dataframe with all numeric values
+        return pd.concat([pd.DataFrame(normalized, columns=self._cont_cols, index=index),
+                          pd.DataFrame(dummies, columns=self._encoded_cat_cols, index=index)], axis=1)
 
     def get_inverse_ohe_min_max_normalized_data(self, transformed_data):
         """Transforms one-hot-encoded and min-max normalized data into raw user-fed data format. transformed_data
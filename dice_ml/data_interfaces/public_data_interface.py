@@ -43,8 +43,9 @@ class PublicData(_BaseData):
                 "continuous_features contains some feature names which are not part of columns in dataframe"
             )
 
+        non_categorical_feature_names = set(self.continuous_feature_names + [self.outcome_name])
         self.categorical_feature_names = [name for name in self.data_df.columns.tolist(
-        ) if name not in self.continuous_feature_names + [self.outcome_name]]
+        ) if name not in non_categorical_feature_names]
 
         self.categorical_feature_indexes = [self.data_df.columns.get_loc(
             name) for name in self.categorical_feature_names if name in self.data_df]
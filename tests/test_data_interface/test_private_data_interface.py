@@ -1,8 +1,11 @@
 from collections import OrderedDict
 
+import numpy as np
+import pandas as pd
 import pytest
 
 import dice_ml
+from dice_ml.utils.exception import UserConfigValidationException
 
 
 @pytest.fixture()
@@ -37,3 +40,89 @@ class TestPrivateDataMethods:
         # feature precision decides the least change that can be made to the feature in optimization,
         # given as 2-decimal place for 'hours_per_week' feature while initiating private Data object.
         assert self.d.get_decimal_precisions()[1] == 2
+
+    def test_encoded_categorical_features(self):
+        res = self.d.get_encoded_categorical_feature_indexes()
+        assert [2, 3, 4, 5] == res[0]  # there are 4 types of workclass
+        assert len(res[1]) == 8  # eight types of education
+        assert len(res[-1]) == 2  # two types of gender
+
+    def test_ohe_min_max_transformed_query_instance(self, sample_adultincome_query):
+        output_query = [0.068, 0.449, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0,
+                        0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 1.0, 0.0]
+        prepared_query = self.d.get_ohe_min_max_normalized_data(query_instance=sample_adultincome_query).iloc[0].tolist()
+        assert output_query == pytest.approx(prepared_query, abs=1e-3)
+
+    def test_features_to_vary(self):
+        assert [2, 3, 4, 5] == self.d.get_indexes_of_features_to_vary(features_to_vary=['workclass'])
+        assert [1, 2, 3, 4, 5] == self.d.get_indexes_of_features_to_vary(features_to_vary=['workclass', 'hours_per_week'])
+        assert [0] == self.d.get_indexes_of_features_to_vary(features_to_vary=['age', 'age'])
+
+    def test_normalize_arrays(self):
+        # continuous features are age in [17, 90] and hours_per_week in [1, 99]
+        cont_arr = np.array([[17.0, 50.0], [90.0, 99.0]])
+        normalized = self.d.normalize_arrays(cont_arr)
+        assert normalized is cont_arr  # normalized in place
+        assert normalized.ravel().tolist() == pytest.approx([0.0, 0.5, 1.0, 1.0])
+        assert self.d.de_normalize_arrays(normalized).ravel().tolist() == pytest.approx([17.0, 50.0, 90.0, 99.0])
+
+    def test_ohe_min_max_transformed_single_instance(self, sample_adultincome_query):
+        expected = self.d.get_ohe_min_max_normalized_data(query_instance=sample_adultincome_query)
+        query_dict = sample_adultincome_query.iloc[0].to_dict()
+        for query_instance in [query_dict, [query_dict[feature] for feature in self.d.feature_names]]:
+            prepared_query = self.d.get_ohe_min_max_normalized_data(query_instance=query_instance)
+            assert prepared_query.columns.tolist() == self.d.ohe_encoded_feature_names
+            assert prepared_query.iloc[0].tolist() == pytest.approx(expected.iloc[0].tolist())
+
+    def test_ohe_min_max_transformed_unknown_category(self, sample_adultincome_query):
+        query_instance = sample_adultincome_query.copy()
+        query_instance['workclass'] = 'Privte'
+        with pytest.raises(UserConfigValidationException) as ucve:
+            self.d.get_ohe_min_max_normalized_data(query_instance=query_instance)
+        assert 'The category Privte does not occur in the training data for feature workclass' in str(ucve.value)
+
+    def test_ohe_min_max_transformed_single_instance_validation(self, sample_adultincome_query):
+        query_list = [sample_adultincome_query.iloc[0][feature] for feature in self.d.feature_names]
+        with pytest.raises(UserConfigValidationException, match='The category Privte does not occur'):
+            self.d.get_ohe_min_max_normalized_data(query_instance=dict(sample_adultincome_query.iloc[0], workclass='Privte'))
+        for query_instance in [query_list[:-1], query_list + [0]]:
+            with pytest.raises(ValueError, match='Query instance should have 8 values'):
+                self.d.get_ohe_min_max_normalized_data(query_instance=query_instance)
+
+    def test_inverse_ohe_min_max_transformed_query_instance(self, sample_adultincome_query):
+        transformed_query = self.d.get_ohe_min_max_normalized_data(query_instance=sample_adultincome_query)
+        decoded_query = self.d.from_dummies(transformed_query)
+        for feature in self.d.categorical_feature_names:
+            # decoded categorical features carry every known category, not only the ones in the data
+            assert decoded_query[feature].cat.categories.tolist() == self.d.categorical_levels[feature]
+        raw_query = self.d.get_inverse_ohe_min_max_normalized_data(transformed_query)
+        assert raw_query.columns.tolist() == self.d.feature_names
+        assert raw_query.iloc[0].tolist() == sample_adultincome_query.iloc[0].tolist()
+        with pytest.raises(ValueError, match="prefix_sep should be '_'"):
+            self.d.from_dummies(transformed_query, prefix_sep='-')
+
+
+def test_inverse_ohe_min_max_round_trip_wide_range():
+    # range x 10^precision is above 2^24, so the normalized values need float64 to round-trip
+    d = dice_ml.Data(features={'age': [17, 90], 'cap': [0, 1000000], 'wc': ['b', 'a', 'c']},
+                     outcome_name='income', type_and_precision={'cap': ['float', 2]})
+    query = pd.DataFrame({'age': [22, 90], 'cap': [999999.99, 123456.78], 'wc': ['a', 'c']})
+    for query_instance in [query, query.iloc[0].tolist()]:
+        decoded = d.get_inverse_ohe_min_max_normalized_data(d.get_ohe_min_max_normalized_data(query_instance))
+        expected = query.head(len(decoded))
+        assert decoded['cap'].tolist() == expected['cap'].tolist()
+        assert decoded['age'].tolist() == expected['age'].tolist()
+
+
+def test_normalize_only_categorical_features():
+    d = dice_ml.Data(features={'c': ['x', 'w']}, outcome_name='y')
+    assert d.normalize_data({'c': 'x'}) == {'c': 'x'}
+    assert d.normalize_data(pd.DataFrame({'c': ['x', 'w']}))['c'].tolist() == ['x', 'w']
+    assert d.get_ohe_min_max_normalized_data({'c': 'x'}).iloc[0].tolist() == [0, 1]
+
+
+def test_normalized_mads_zero_range_feature():
+    d = dice_ml.Data(features={'a': [5, 5], 'b': [0, 10], 'c': ['x', 'w']}, outcome_name='y', mad={'a': 2, 'b': 5})
+    # 'a' has min == max, so its MAD cannot be normalized and the practical value 1.0 is used instead
+    assert d.get_mads(normalized=True) == {'b': 0.5}
+    assert d.get_valid_mads(normalized=True) == {'a': 1.0, 'b': 0.5}